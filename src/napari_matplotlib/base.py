@@ -1,8 +1,11 @@
 import os
 from pathlib import Path
+from typing import Any
 
 import matplotlib.style as mplstyle
 import napari
+from matplotlib.artist import Artist
+from matplotlib.backend_bases import DrawEvent
 from matplotlib.backends.backend_qtagg import (  # type: ignore[attr-defined]
     FigureCanvasQTAgg,
     NavigationToolbar2QT,
@@ -255,7 +258,18 @@ class NapariMPLWidget(BaseNapariMPLWidget):
             self.clear()
             if self._valid_layer_selection:
                 self.draw()
-            self.canvas.draw()  # type: ignore[no-untyped-call]
+            self._draw_canvas()
+
+    def _draw_canvas(self) -> None:
+        """
+        Request a render of the figure to the canvas.
+
+        The render happens the next time Qt processes events, so several
+        re-draws in the same event loop iteration only render once.
+        Derived classes can override this to re-render only part of the
+        canvas when possible.
+        """
+        self.canvas.draw_idle()  # type: ignore[no-untyped-call]
 
     def clear(self) -> None:
         """
@@ -283,6 +297,12 @@ class SingleAxesWidget(NapariMPLWidget):
     """
     In addition to `NapariMPLWidget`, this sets up a single axes and
     the callback to clear it.
+
+    Sub-classes that draw a single data artist can store it in ``_artist``
+    in their ``draw()`` method. When clearing, only that artist and the
+    axes labels are then removed, instead of re-creating the whole axes.
+    Re-draws that only change the data artist are also blitted onto a
+    cached background, instead of re-rendering the whole figure.
     """
 
     def __init__(
@@ -292,14 +312,130 @@ class SingleAxesWidget(NapariMPLWidget):
     ):
         super().__init__(napari_viewer=napari_viewer, parent=parent)
         self.add_single_axes()
+        # Data artist drawn by the last call to draw(), if set by sub-classes
+        self._artist: Artist | None = None
+        # If True, the next call to clear() clears the whole axes
+        self._clear_axes = False
+        # Canvas background without the data artist, and the state of the
+        # axes frame when it was captured, used to blit re-draws
+        self._background: Any = None
+        self._background_frame: tuple[Any, ...] | None = None
+        # Connection id of the pending callback that captures the background
+        # after the next full render, if there is one
+        self._capture_cid: int | None = None
+
+    def _on_napari_theme_changed(self, event: Event) -> None:
+        """
+        Clear the whole axes on the next re-draw, to apply the new style.
+
+        Parameters
+        ----------
+        event : napari.utils.events.Event
+            Event that triggered the callback.
+        """
+        self._clear_axes = True
+        self._background = None
+        super()._on_napari_theme_changed(event)
 
     def clear(self) -> None:
         """
         Clear the axes.
         """
+        if self._artist is not None:
+            # The artist may be re-used, so make sure it's drawn normally
+            self._artist.set_animated(False)
         with mplstyle.context(self.napari_theme_style_sheet):
-            self.axes.clear()
+            if self._artist is None or self._clear_axes:
+                self.axes.clear()
+                self._clear_axes = False
+            else:
+                self._artist.remove()
+                self.axes.set_title("")
+                self.axes.set_xlabel("")
+                self.axes.set_ylabel("")
+                # Reset data limits and autoscaling, as a fresh axes would
+                self.axes.ignore_existing_data_limits = True
+                self.axes.set_autoscale_on(True)
+        self._artist = None
+
+    def _get_frame(self) -> tuple[Any, ...]:
+        """
+        Get the state of everything drawn on the axes apart from the data.
+        """
+        return (
+            self.axes.get_xlim(),
+            self.axes.get_ylim(),
+            self.axes.get_title(),
+            self.axes.get_xlabel(),
+            self.axes.get_ylabel(),
+            self.axes.bbox.bounds,
+        )
 
+    def _draw_canvas(self) -> None:
+        """
+        Render the figure to the canvas.
+
+        If only the data has changed since the last render, the cached
+        background is restored and only the data artist is re-drawn on top.
+        Otherwise a full render is requested, which happens the next time
+        Qt processes events, and the background is captured after it.
+        """
+        if self._artist is None:
+            self._background = None
+            super()._draw_canvas()
+            return
+
+        if (
+            self._background is not None
+            and self._get_frame() == self._background_frame
+        ):
+            self.canvas.restore_region(  # type: ignore[no-untyped-call]
+                self._background
+            )
+            self.axes.draw_artist(self._artist)
+            self.canvas.blit(self.axes.bbox)  # type: ignore[no-untyped-call]
+            return
+
+        # Full re-draw, rendering the background without the data
+        self._background = None
+        self._artist.set_animated(True)
+        if self._capture_cid is None:
+            self._capture_cid = self.canvas.mpl_connect(
+                "draw_event", self._capture_background
+            )
+        super()._draw_canvas()
+
+    def _capture_background(self, event: DrawEvent) -> None:
+        """
+        Capture the rendered background, and draw the data artist on top.
+
+        This is called once, after the next full render of the canvas.
+
+        Parameters
+        ----------
+        event : matplotlib.backend_bases.DrawEvent
+            Event that triggered the callback.
+        """
+        if self.canvas.is_saving():
+            # Saved figures include the data artist, so wait for a render
+            # to the canvas instead
+            return
+        if self._capture_cid is not None:
+            self.canvas.mpl_disconnect(self._capture_cid)
+            self._capture_cid = None
+        if self._artist is None:
+            return
+
+        self._background = (
+            self.canvas.copy_from_bbox(  # type: ignore[no-untyped-call]
+                self.axes.bbox
+            )
+        )
+        # Layout is only updated on a full draw, so get the frame after
+        self._background_frame = self._get_frame()
+        self._artist.set_animated(False)
+        self.axes.draw_artist(self._artist)
+        self.canvas.blit(self.axes.bbox)  # type: ignore[no-untyped-call]
 
 class NapariNavigationToolbar(NavigationToolbar2QT):
     """Custom Toolbar style for Napari."""
@@ -67,6 +67,8 @@ class HistogramWidget(SingleAxesWidget):
         parent: QWidget | None = None,
     ):
         super().__init__(napari_viewer, parent=parent)
+        # Layer whose contrast limit events are connected to this widget
+        self._contrast_limits_layer: Image | None = None
 
         num_bins_widget = QSpinBox()
         num_bins_widget.setRange(1, 100_000)
@@ -92,17 +94,25 @@ class HistogramWidget(SingleAxesWidget):
         self.num_bins_widget = num_bins_widget
 
         self._update_layers(None)
-        self.viewer.events.theme.connect(self._on_napari_theme_changed)
 
     def on_update_layers(self) -> None:
         """
         Called when the selected layers are updated.
         """
         super().on_update_layers()
+        # Disconnect from the previously selected layer, so changing its
+        # contrast limits doesn't re-draw this widget
+        if self._contrast_limits_layer is not None:
+            self._contrast_limits_layer.events.contrast_limits.disconnect(
+                self._update_contrast_lims
+            )
+            self._contrast_limits_layer = None
+
         if self._valid_layer_selection:
             self.layers[0].events.contrast_limits.connect(
                 self._update_contrast_lims
             )
+            self._contrast_limits_layer = self.layers[0]
 
         if not self.layers:
             return
@@ -115,9 +125,9 @@ class HistogramWidget(SingleAxesWidget):
         for lim, line in zip(
             self.layers[0].contrast_limits, self._contrast_lines, strict=False
         ):
-            line.set_xdata(lim)
+            line.set_xdata([lim, lim])
 
-        self.figure.canvas.draw()
+        self.figure.canvas.draw_idle()
 
     def _set_widget_nums_bins(self, data: npt.NDArray[Any]) -> None:
         """Update num_bins widget with bins determined from the image data"""
@@ -191,6 +201,7 @@ class FeaturesHistogramWidget(SingleAxesWidget):
         parent: QWidget | None = None,
     ):
         super().__init__(napari_viewer, parent=parent)
+        self._x_axis_key: str | None = None
 
         self.layout().addLayout(QVBoxLayout())
         self._key_selection_widget = QComboBox()
@@ -210,11 +221,12 @@ class FeaturesHistogramWidget(SingleAxesWidget):
 
     @x_axis_key.setter
     def x_axis_key(self, key: str | None) -> None:
-        self._x_axis_key = key
-        self._draw()
+        self._set_axis_keys(key)
 
-    def _set_axis_keys(self, x_axis_key: str) -> None:
+    def _set_axis_keys(self, x_axis_key: str | None) -> None:
         """Set both axis keys and then redraw the plot"""
+        if x_axis_key == self._x_axis_key:
+            return
         self._x_axis_key = x_axis_key
         self._draw()
 
@@ -1,7 +1,9 @@
 from typing import Any
 
 import napari
+import numpy as np
 import numpy.typing as npt
+from matplotlib.collections import PathCollection, QuadMesh
 from qtpy.QtWidgets import QComboBox, QLabel, QVBoxLayout, QWidget
 
 from .base import SingleAxesWidget
@@ -11,6 +13,125 @@ from .util import Interval
 __all__ = ["ScatterBaseWidget", "ScatterWidget", "FeaturesScatterWidget"]
 
 
+def _get_num_bins_2d(n_points: int) -> int:
+    """
+    Get the number of bins along each axis of a 2D histogram.
+
+    This scales with the square root of the number of points, so large
+    datasets are histogrammed at a higher resolution.
+
+    Parameters
+    ----------
+    n_points : int
+        Number of points being histogrammed.
+
+    Returns
+    -------
+    num_bins : int
+        Number of bins, between 100 and 512.
+    """
+    return int(np.clip(np.sqrt(n_points) / 4, 100, 512))
+
+
+def _bin_indices(
+    data: npt.NDArray[Any], num_bins: int
+) -> tuple[npt.NDArray[np.intp], npt.NDArray[Any]]:
+    """
+    Get the bin index of each value, for evenly spaced bins spanning the data.
+
+    Bins are half open, apart from the last bin which also includes the
+    right hand edge. This matches the binning done by `numpy.histogram2d`.
+
+    Parameters
+    ----------
+    data : numpy.ndarray
+        1D array, containing only finite values.
+    num_bins : int
+        Number of bins.
+
+    Returns
+    -------
+    indices : numpy.ndarray
+        Bin index of each value in ``data``.
+    edges : numpy.ndarray
+        Bin edges.
+    """
+    first_edge, last_edge = data.min(), data.max()
+    if first_edge == last_edge:
+        first_edge, last_edge = first_edge - 0.5, last_edge + 0.5
+    edges = np.linspace(first_edge, last_edge, num_bins + 1)
+
+    # Directly compute the bin index, instead of searching through the edges.
+    # Subtract in the edge dtype, so integer data can't overflow.
+    scale = num_bins / (edges[-1] - edges[0])
+    offsets = np.subtract(data, first_edge, dtype=edges.dtype)
+    indices = (offsets * scale).astype(np.intp)
+    np.clip(indices, 0, num_bins - 1, out=indices)
+    # The computed index can be off by one within rounding error of a bin
+    # edge, so correct against the actual edges
+    indices[data < edges[indices]] -= 1
+    indices[(data >= edges[indices + 1]) & (indices != num_bins - 1)] += 1
+    return indices, edges
+
+
+def _histogram2d(
+    x: npt.NDArray[Any], y: npt.NDArray[Any], num_bins: int
+) -> tuple[npt.NDArray[np.intp], npt.NDArray[Any], npt.NDArray[Any]]:
+    """
+    Compute a 2D histogram with evenly spaced bins spanning the data.
+
+    For ``x`` and ``y`` of the same dtype this gives the same result as
+    ``numpy.histogram2d(x, y, bins=num_bins)``, but is faster because the
+    bins are known to be evenly spaced.
+
+    Parameters
+    ----------
+    x, y : numpy.ndarray
+        1D arrays of the same length, containing only finite values.
+    num_bins : int
+        Number of bins along each axis.
+
+    Returns
+    -------
+    counts : numpy.ndarray
+        Number of points in each bin, with x along the first axis.
+    x_edges, y_edges : numpy.ndarray
+        Bin edges along each axis.
+    """
+    x_indices, x_edges = _bin_indices(x, num_bins)
+    y_indices, y_edges = _bin_indices(y, num_bins)
+    counts = np.bincount(
+        x_indices * num_bins + y_indices, minlength=num_bins**2
+    ).reshape(num_bins, num_bins)
+    return counts, x_edges, y_edges
+
+
+def _finite_pairs(
+    x: npt.NDArray[Any], y: npt.NDArray[Any]
+) -> tuple[npt.NDArray[Any], npt.NDArray[Any]]:
+    """
+    Remove pairs of points where either x or y is not finite.
+
+    Parameters
+    ----------
+    x, y : numpy.ndarray
+        1D arrays of the same length.
+
+    Returns
+    -------
+    x, y : numpy.ndarray
+        The input arrays, without any NaN or infinite pairs. If all pairs are
+        finite the input arrays are returned without copying.
+    """
+    if x.dtype.kind not in {"f", "c"} and y.dtype.kind not in {"f", "c"}:
+        # Only floating point data can be non-finite
+        return x, y
+    finite = np.isfinite(x) & np.isfinite(y)
+    if finite.all():
+        return x, y
+    return x[finite], y[finite]
+
+
 class ScatterBaseWidget(SingleAxesWidget):
     """
     Base class for widgets that scatter two datasets against each other.
@@ -20,6 +141,18 @@ class ScatterBaseWidget(SingleAxesWidget):
     # the scatter is plotted as a 2D histogram
     _threshold_to_switch_to_histogram = 500
 
+    def __init__(
+        self,
+        napari_viewer: napari.viewer.Viewer,
+        parent: QWidget | None = None,
+    ):
+        super().__init__(napari_viewer, parent=parent)
+        # Artists are kept between re-draws so their data can be updated
+        # in place, instead of being re-created from scratch every time
+        self._scatter_artist: PathCollection | None = None
+        self._hist_artist: QuadMesh | None = None
+        self._hist_edges: tuple[npt.NDArray[Any], ...] | None = None
+
     def draw(self) -> None:
         """
         Scatter the currently selected layers.
@@ -27,19 +160,60 @@ class ScatterBaseWidget(SingleAxesWidget):
         if len(self.layers) == 0:
             return
         x, y, x_axis_name, y_axis_name = self._get_data()
+        # Read lazy data (e.g. dask arrays) into memory
+        x, y = _finite_pairs(np.asarray(x).ravel(), np.asarray(y).ravel())
 
         if x.size > self._threshold_to_switch_to_histogram:
-            self.axes.hist2d(
-                x.ravel(),
-                y.ravel(),
-                bins=100,
-            )
+            self._draw_histogram(x, y)
         else:
-            self.axes.scatter(x, y, alpha=0.5)
+            self._draw_scatter(x, y)
 
         self.axes.set_xlabel(x_axis_name)
         self.axes.set_ylabel(y_axis_name)
 
+    def _draw_scatter(self, x: npt.NDArray[Any], y: npt.NDArray[Any]) -> None:
+        """
+        Scatter x against y, re-using the previous artist if there is one.
+        """
+        if self._scatter_artist is None:
+            self._scatter_artist = self.axes.scatter(x, y, alpha=0.5)
+        else:
+            self._scatter_artist.set_offsets(np.column_stack([x, y]))
+            self.axes.add_collection(self._scatter_artist)
+            self.axes.autoscale_view()
+        self._artist = self._scatter_artist
+
+    def _draw_histogram(
+        self, x: npt.NDArray[Any], y: npt.NDArray[Any]
+    ) -> None:
+        """
+        Draw a 2D histogram of x against y.
+
+        This is equivalent to ``Axes.hist2d``, but re-uses the previous
+        mesh if the bin edges have not changed.
+        """
+        counts, x_edges, y_edges = _histogram2d(
+            x, y, num_bins=_get_num_bins_2d(x.size)
+        )
+        if (
+            self._hist_artist is not None
+            and self._hist_edges is not None
+            and np.array_equal(x_edges, self._hist_edges[0])
+            and np.array_equal(y_edges, self._hist_edges[1])
+        ):
+            self._hist_artist.set_array(counts.T)
+            self._hist_artist.autoscale()
+            self.axes.add_collection(self._hist_artist, autolim=False)
+        else:
+            self._hist_artist = self.axes.pcolormesh(
+                x_edges, y_edges, counts.T
+            )
+            self._hist_edges = (x_edges, y_edges)
+        self._artist = self._hist_artist
+
+        self.axes.set_xlim(x_edges[0], x_edges[-1])
+        self.axes.set_ylim(y_edges[0], y_edges[-1])
+
     def _get_data(self) -> tuple[npt.NDArray[Any], npt.NDArray[Any], str, str]:
         """
         Get the plot data.
@@ -129,8 +303,10 @@ class FeaturesScatterWidget(ScatterBaseWidget):
 
     @x_axis_key.setter
     def x_axis_key(self, key: str) -> None:
+        if key == self.x_axis_key:
+            return
+        # Changing the combobox text triggers a re-draw
         self._selectors["x"].setCurrentText(key)
-        self._draw()
 
     @property
     def y_axis_key(self) -> str | None:
@@ -144,8 +320,10 @@ class FeaturesScatterWidget(ScatterBaseWidget):
 
     @y_axis_key.setter
     def y_axis_key(self, key: str) -> None:
+        if key == self.y_axis_key:
+            return
+        # Changing the combobox text triggers a re-draw
         self._selectors["y"].setCurrentText(key)
-        self._draw()
 
     def _get_valid_axis_keys(self) -> list[str]:
         """
@@ -183,9 +361,32 @@ class FeaturesScatterWidget(ScatterBaseWidget):
         """
         Scatter two features from the currently selected layer.
         """
-        if self._ready_to_scatter():
+        if not self._ready_to_scatter():
+            return
+        if self.x_axis_key == self.y_axis_key:
+            self._draw_identity()
+        else:
             super().draw()
 
+    def _draw_identity(self) -> None:
+        """
+        Draw a feature scattered against itself.
+
+        All the points lie on the diagonal, so a single line spanning the
+        data range is drawn instead of scattering or histogramming them.
+        """
+        feature_table = self.layers[0].features
+        data = feature_table[self.x_axis_key].to_numpy(copy=False)
+        data, _ = _finite_pairs(data, data)
+        if data.size > 0:
+            limits = [data.min(), data.max()]
+            # Fix the colour, as the axes colour cycle is no longer reset
+            # between re-draws
+            (self._artist,) = self.axes.plot(limits, limits, color="C0")
+
+        self.axes.set_xlabel(str(self.x_axis_key))
+        self.axes.set_ylabel(str(self.y_axis_key))
+
     def _get_data(self) -> tuple[npt.NDArray[Any], npt.NDArray[Any], str, str]:
         """
         Get the plot data from the ``features`` attribute of the first
@@ -205,8 +406,9 @@ class FeaturesScatterWidget(ScatterBaseWidget):
         """
         feature_table = self.layers[0].features
 
-        x = feature_table[self.x_axis_key]
-        y = feature_table[self.y_axis_key]
+        # Convert columns to arrays once, instead of on every use downstream
+        x = feature_table[self.x_axis_key].to_numpy(copy=False)
+        y = feature_table[self.y_axis_key].to_numpy(copy=False)
 
         x_axis_name = str(self.x_axis_key)
         y_axis_name = str(self.y_axis_key)
@@ -217,9 +419,17 @@ class FeaturesScatterWidget(ScatterBaseWidget):
         """
         Called when the layer selection changes by ``self.update_layers()``.
         """
-        # Clear combobox
-        for dim in ["x", "y"]:
-            while self._selectors[dim].count() > 0:
-                self._selectors[dim].removeItem(0)
+        axis_keys = self._get_valid_axis_keys()
+        for selector in self._selectors.values():
+            # Block signals while re-populating the combobox, to avoid a
+            # re-draw for every item that is removed or added
+            selector.blockSignals(True)
+            selector.clear()
             # Add keys for newly selected layer
-            self._selectors[dim].addItems(self._get_valid_axis_keys())
+            selector.addItems(axis_keys)
+            selector.blockSignals(False)
+
+        if not self._valid_layer_selection:
+            # Valid selections are re-drawn by self._update_layers(), but
+            # any previous plot still needs clearing
+            self._draw()
@@ -4,7 +4,8 @@ import matplotlib.ticker as mticker
 import napari
 import numpy as np
 import numpy.typing as npt
-from qtpy.QtCore import Qt
+from matplotlib.lines import Line2D
+from qtpy.QtCore import Qt, QTimer
 from qtpy.QtWidgets import (
     QComboBox,
     QLabel,
@@ -18,6 +19,57 @@ from .util import Interval
 
 __all__ = ["SliceWidget"]
 
+# Axis of the in view (y, x) plane that each slice dimension runs along
+_PLANE_AXIS = {"y": 0, "x": 1}
+# Numpy axis of each slice dimension, keyed by (data ndim, dimension name)
+_DIM_INDEX = {
+    (2, "y"): 0,
+    (2, "x"): 1,
+    (3, "z"): 0,
+    (3, "y"): 1,
+    (3, "x"): 2,
+}
+#: Number of rows or columns read at once from lazy data without chunks
+_BLOCK_SIZE = 64
+
+
+def _plane_index(axis: int, index: int | slice) -> tuple[int | slice, ...]:
+    """
+    Index a (y, x) plane along the whole of ``axis``, and with ``index``
+    along the other axis.
+    """
+    return (slice(None), index) if axis == 0 else (index, slice(None))
+
+
+def _get_chunk_range(data: Any, axis: int, index: int) -> range:
+    """
+    Get the range of indices in the chunk of ``data`` containing ``index``.
+
+    Parameters
+    ----------
+    data :
+        Array-like data. Both dask style chunks (the size of every chunk
+        along each axis) and zarr/h5py style chunks (one chunk size for each
+        axis) are supported. If the data isn't chunked, blocks of
+        ``_BLOCK_SIZE`` indices are used.
+    axis :
+        Axis to find the chunk along.
+    index :
+        Index along ``axis``.
+    """
+    chunks = getattr(data, "chunks", None)
+    chunk = _BLOCK_SIZE if chunks is None else chunks[axis]
+    if isinstance(chunk, tuple):
+        # Chunk sizes can vary along the axis
+        stop = 0
+        for size in chunk:
+            start, stop = stop, stop + size
+            if index < stop:
+                return range(start, stop)
+        raise IndexError(f"Index {index} is out of range for axis {axis}")
+    start = index - index % chunk
+    return range(start, min(start + chunk, data.shape[axis]))
+
 
 class SliceWidget(SingleAxesWidget):
     """
@@ -26,6 +78,8 @@ class SliceWidget(SingleAxesWidget):
 
     n_layers_input = Interval(1, 1)
     input_layer_types = (napari.layers.Image,)
+    #: Delay before re-drawing after a selector changes, in milliseconds
+    _redraw_delay = 20
 
     def __init__(
         self,
@@ -39,6 +93,21 @@ class SliceWidget(SingleAxesWidget):
         self.dim_selector.addItems(["x", "y"])
 
         self.slice_selector = QSlider(orientation=Qt.Orientation.Horizontal)
+        # x-values of the plot, which only change if the slice width changes
+        self._x: npt.NDArray[np.int_] | None = None
+        # Plotted line, kept between re-draws so its data can be updated
+        self._line: Line2D | None = None
+        # Chunk of rows or columns of lazy layer data, read into memory,
+        # the data and (z-index, plotted axis) it was read for, and the
+        # range of rows or columns it covers. The data itself is kept, and
+        # compared by identity, as ids can be re-used once it is freed.
+        self._block: npt.NDArray[Any] | None = None
+        self._block_data: Any = None
+        self._block_key: tuple[Any, ...] | None = None
+        self._block_range = range(0)
+        # Inputs to the last re-draw, used to skip re-draws that would
+        # plot exactly the same slice
+        self._draw_signature: tuple[Any, ...] | None = None
 
         # Create widget layout
         button_layout = QVBoxLayout()
@@ -48,16 +117,75 @@ class SliceWidget(SingleAxesWidget):
         self.layout().addLayout(button_layout)
 
         # Setup callbacks
-        # Re-draw when any of the combo/slider is updated
-        self.dim_selector.currentTextChanged.connect(self._draw)
-        self.slice_selector.valueChanged.connect(self._draw)
+        # Re-draw when any of the combo/slider is updated. The re-draw is
+        # delayed slightly, so a burst of changes (e.g. from dragging the
+        # slider) only re-draws once.
+        self._redraw_timer = QTimer(self)
+        self._redraw_timer.setSingleShot(True)
+        self._redraw_timer.setInterval(self._redraw_delay)
+        self._redraw_timer.timeout.connect(self._draw)
+        self.dim_selector.currentTextChanged.connect(self._schedule_draw)
+        self.slice_selector.valueChanged.connect(self._schedule_draw)
 
         self._update_layers(None)
 
+    def _schedule_draw(self) -> None:
+        """
+        Re-draw after a short delay, restarting the delay if already waiting.
+        """
+        self._redraw_timer.start()
+
+    def _get_draw_signature(self) -> tuple[Any, ...] | None:
+        """
+        Get the inputs that determine what is plotted.
+
+        Returns
+        -------
+        signature : tuple or None
+            The layer, its data, and the other inputs. None if there is no
+            valid layer selection to plot.
+        """
+        if not self._valid_layer_selection:
+            return None
+        layer = self._layer
+        return (
+            layer,
+            layer.data,
+            layer.name,
+            layer.data.shape,
+            self.current_dim_name,
+            self.slice_selector.value(),
+            self.current_z,
+        )
+
+    def _draw(self) -> None:
+        """
+        Re-draw, unless the plotted slice would be the same as last time.
+        """
+        signature = self._get_draw_signature()
+        last = self._draw_signature
+        if (
+            signature is not None
+            and last is not None
+            # Compare the layer and data by identity, as ids can be re-used
+            # once they are freed, and arrays can't be compared with ==
+            and signature[0] is last[0]
+            and signature[1] is last[1]
+            and signature[2:] == last[2:]
+            and not self._clear_axes
+        ):
+            return
+        self._draw_signature = signature
+        super()._draw()
+
     def on_update_layers(self) -> None:
         """
         Called when layer selection is updated.
         """
+        # Don't keep the previous layer's data in memory
+        self._block = None
+        self._block_data = None
+        self._block_key = None
         if not len(self.layers):
             return
         if self.current_dim_name == "x":
@@ -94,8 +222,10 @@ class SliceWidget(SingleAxesWidget):
         """
         Currently selected slice dimension index.
         """
-        # Note the reversed list because in napari the z-axis is the first
-        # numpy axis
+        key = (self._layer.data.ndim, self.current_dim_name)
+        if key in _DIM_INDEX:
+            return _DIM_INDEX[key]
+        # Raises an error for unsupported dimensions
         return self._dim_names.index(self.current_dim_name)
 
     @property
@@ -111,26 +241,64 @@ class SliceWidget(SingleAxesWidget):
         else:
             raise RuntimeError("Don't know how to handle ndim != 2 or 3")
 
+    def _get_block(
+        self, data: Any, z: tuple[int, ...], axis: int, val: int
+    ) -> npt.NDArray[Any]:
+        """
+        Get the chunk of lazy data (e.g. a dask array) containing a slice.
+
+        Only the rows or columns in the chunk containing the slice are read
+        into memory. They are kept, so that moving the slice selector within
+        the same chunk doesn't read the data again.
+
+        Parameters
+        ----------
+        data :
+            Layer data.
+        z :
+            Index of the in view plane, empty for 2D data.
+        axis :
+            Axis of the in view plane being plotted along.
+        val :
+            Value of the slice selector.
+        """
+        key = (z, axis)
+        if (
+            self._block is None
+            or data is not self._block_data
+            or key != self._block_key
+            or val not in self._block_range
+        ):
+            # Axis of the data that the slice selector moves along
+            swept_axis = data.ndim - 1 - axis
+            rows = _get_chunk_range(data, swept_axis, val)
+            block = slice(rows.start, rows.stop)
+            self._block = np.asarray(data[z + _plane_index(axis, block)])
+            self._block_data = data
+            self._block_key = key
+            self._block_range = rows
+        return self._block
+
     def _get_xy(self) -> tuple[npt.NDArray[Any], npt.NDArray[Any]]:
         """
         Get data for plotting.
         """
+        data = self._layer.data
+        axis = _PLANE_AXIS[self.current_dim_name]
         val = self.slice_selector.value()
+        z = (self.current_z,) if data.ndim == 3 else ()
 
-        slices = []
-        for dim_name in self._dim_names:
-            if dim_name == self.current_dim_name:
-                # Select all data along this axis
-                slices.append(slice(None))
-            elif dim_name == "z":
-                # Only select the currently viewed z-index
-                slices.append(slice(self.current_z, self.current_z + 1))
-            else:
-                # Select specific index
-                slices.append(slice(val, val + 1))
-
-        x = np.arange(self._slice_width)
-        y = self._layer.data[tuple(slices)].ravel()
+        if isinstance(data, np.ndarray):
+            # Indexing with integers drops the other axes, so this is
+            # already a 1D (possibly strided) view of the data, without a copy
+            y = data[z + _plane_index(axis, val)]
+        else:
+            block = self._get_block(data, z, axis, val)
+            y = block[_plane_index(axis, val - self._block_range.start)]
+
+        if self._x is None or self._x.size != y.size:
+            self._x = np.arange(y.size)
+        x = self._x
 
         return x, y
 
@@ -140,7 +308,14 @@ class SliceWidget(SingleAxesWidget):
         """
         x, y = self._get_xy()
 
-        self.axes.plot(x, y)
+        if self._line is None:
+            (self._line,) = self.axes.plot(x, y)
+        else:
+            self._line.set_data(x, y)
+            self.axes.add_line(self._line)
+            self.axes.autoscale_view()
+        self._artist = self._line
+
         self.axes.set_xlabel(self.current_dim_name)
         self.axes.set_title(self._layer.name)
         # Make sure all ticks lie on integer values
@@ -17,14 +17,22 @@ def image_data(request):
     return np.ones(request.param[0]), request.param[1]
 
 
-@pytest.fixture
+def _read_only(arr):
+    """
+    Make an array read-only, so tests sharing it can't modify it.
+    """
+    arr.setflags(write=False)
+    return arr
+
+
+@pytest.fixture(scope="session")
 def astronaut_data():
-    return data.astronaut(), {"rgb": True}
+    return _read_only(data.astronaut()), {"rgb": True}
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def brain_data():
-    return data.brain(), {"rgb": False}
+    return _read_only(data.brain()), {"rgb": False}
 
 
 @pytest.fixture
@@ -41,6 +49,32 @@ def points_with_features_data():
     return points_data, {"features": points_features}
 
 
+@pytest.fixture(scope="session")
+def random_vectors_data():
+    """
+    Random vectors with one feature, generated once per test session.
+    """
+    n_points = 1000
+    rng = np.random.RandomState(42)
+    random_points = rng.random_sample((n_points, 3)) * 10
+    random_directions = rng.random_sample((n_points, 3)) * 10
+    random_vectors = np.stack([random_points, random_directions], axis=1)
+    feature1 = rng.random_sample(n_points)
+    return random_vectors, {"feature1": feature1}
+
+
+@pytest.fixture(scope="session")
+def random_points_data():
+    """
+    Random 3D points with one feature, generated once per test session.
+    """
+    n_points = 1000
+    rng = np.random.RandomState(0)
+    random_points = rng.random_sample((n_points, 3)) * 10
+    feature1 = rng.random_sample(n_points)
+    return random_points, {"feature1": feature1}
+
+
 @pytest.fixture(autouse=True, scope="session")
 def set_strict_qt():
     env_var = "NAPARI_STRICT_QT"
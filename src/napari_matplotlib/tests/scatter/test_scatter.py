@@ -1,8 +1,10 @@
 from copy import deepcopy
 
+import numpy as np
 import pytest
 
 from napari_matplotlib import ScatterBaseWidget, ScatterWidget
+from napari_matplotlib.scatter import _histogram2d
 
 
 @pytest.mark.mpl_image_compare
@@ -23,8 +25,7 @@ def test_scatter_2D(make_napari_viewer, astronaut_data):
     viewer.layers.selection.clear()
 
     # Select images
-    viewer.layers.selection.add(viewer.layers[0])
-    viewer.layers.selection.add(viewer.layers[1])
+    viewer.layers.selection.update([viewer.layers[0], viewer.layers[1]])
     return deepcopy(fig)
 
 
@@ -46,8 +47,7 @@ def test_scatter_3D(make_napari_viewer, brain_data):
     slice_no = brain_data[0].shape[0] - 1
     viewer.dims.set_current_step(axis, slice_no)
     # Select images
-    viewer.layers.selection.add(viewer.layers[0])
-    viewer.layers.selection.add(viewer.layers[1])
+    viewer.layers.selection.update([viewer.layers[0], viewer.layers[1]])
 
     return deepcopy(fig)
 
@@ -57,3 +57,45 @@ def test_get_data_notimplemented_on_base(make_napari_viewer):
     widget = ScatterBaseWidget(viewer)
     with pytest.raises(NotImplementedError):
         widget._get_data()
+
+
+def test_scatter_dask(make_napari_viewer, brain_data):
+    da = pytest.importorskip("dask.array")
+    viewer = make_napari_viewer()
+    widget = ScatterWidget(viewer)
+
+    data = brain_data[0]
+    viewer.add_image(da.from_array(data, chunks=(1, 64, 64)), name="brain")
+    viewer.add_image(
+        da.from_array(-1.0 * data, chunks=(1, 64, 64)), name="brain_reversed"
+    )
+    viewer.layers.selection.clear()
+    viewer.layers.selection.update([viewer.layers[0], viewer.layers[1]])
+
+    # The slices have more points than the histogram threshold
+    assert widget._hist_artist is not None
+    counts = widget._hist_artist.get_array()
+    assert counts.sum() == data[viewer.dims.current_step[0]].size
+
+
+@pytest.mark.parametrize(
+    "x, y",
+    [
+        # Integer data, with lots of values on the bin edges
+        (np.arange(1000) % 256, np.arange(1000) % 7),
+        (
+            np.random.default_rng(0).random(1000),
+            np.random.default_rng(1).normal(size=1000),
+        ),
+        # All values the same
+        (np.ones(1000), np.arange(1000.0)),
+    ],
+)
+def test_histogram2d(x, y):
+    counts, x_edges, y_edges = _histogram2d(x, y, num_bins=100)
+    expected_counts, expected_x_edges, expected_y_edges = np.histogram2d(
+        x, y, bins=100
+    )
+    np.testing.assert_equal(counts, expected_counts)
+    np.testing.assert_equal(x_edges, expected_x_edges)
+    np.testing.assert_equal(y_edges, expected_y_edges)
@@ -1,8 +1,6 @@
 from copy import deepcopy
-from typing import Any
 
 import numpy as np
-import numpy.typing as npt
 import pytest
 
 from napari_matplotlib import FeaturesScatterWidget
@@ -33,29 +31,38 @@ def test_features_scatter_widget_2D(
     return deepcopy(fig)
 
 
-def make_labels_layer_with_features() -> (
-    tuple[npt.NDArray[np.uint16], dict[str, Any]]
-):
-    label_image: npt.NDArray[np.uint16] = np.zeros((100, 100), dtype=np.uint16)
+@pytest.fixture(scope="module")
+def label_image():
+    """
+    Label image with three square labels, shared by the tests in this module.
+    """
+    label_image = np.zeros((100, 100), dtype=np.uint16)
     for label_value, start_index in enumerate([10, 30, 50], start=1):
         end_index = start_index + 10
         label_image[start_index:end_index, start_index:end_index] = label_value
-    feature_table = {
+    return label_image
+
+
+@pytest.fixture
+def feature_table():
+    """
+    Random features for the labels in `label_image`.
+    """
+    rng = np.random.default_rng(0)
+    return {
         "index": [1, 2, 3],
-        "feature_0": np.random.random((3,)),
-        "feature_1": np.random.random((3,)),
-        "feature_2": np.random.random((3,)),
+        "feature_0": rng.random((3,)),
+        "feature_1": rng.random((3,)),
+        "feature_2": rng.random((3,)),
     }
-    return label_image, feature_table
 
 
-def test_features_scatter_get_data(make_napari_viewer):
+def test_features_scatter_get_data(
+    make_napari_viewer, label_image, feature_table
+):
     """
     Test the get data method.
     """
-    # make the label image
-    label_image, feature_table = make_labels_layer_with_features()
-
     viewer = make_napari_viewer()
     labels_layer = viewer.add_labels(label_image, features=feature_table)
     scatter_widget = FeaturesScatterWidget(viewer)
@@ -70,39 +77,33 @@ def test_features_scatter_get_data(make_napari_viewer):
 
     x, y, x_axis_name, y_axis_name = scatter_widget._get_data()
     np.testing.assert_allclose(x, feature_table[x_column])
-    np.testing.assert_allclose(y, np.stack(feature_table[y_column]))
+    np.testing.assert_allclose(y, feature_table[y_column])
     assert x_axis_name == x_column
     assert y_axis_name == y_column
 
 
-def test_get_valid_axis_keys(make_napari_viewer):
+def test_get_valid_axis_keys(make_napari_viewer, label_image, feature_table):
     """
     Test the values returned from _get_valid_keys() when there
     are valid keys.
     """
-    # make the label image
-    label_image, feature_table = make_labels_layer_with_features()
-
     viewer = make_napari_viewer()
     labels_layer = viewer.add_labels(label_image, features=feature_table)
     scatter_widget = FeaturesScatterWidget(viewer)
 
     viewer.layers.selection = [labels_layer]
     valid_keys = scatter_widget._get_valid_axis_keys()
-    assert set(valid_keys) == set(feature_table.keys())
+    assert feature_table.keys() == set(valid_keys)
 
 
-def test_get_valid_axis_keys_no_valid_keys(make_napari_viewer):
+def test_get_valid_axis_keys_no_valid_keys(make_napari_viewer, label_image):
     """Test the values returned from
     FeaturesScatterWidget._get_valid_keys() when there
     are not valid keys.
     """
-    # make the label image
-    label_image, _ = make_labels_layer_with_features()
-
     viewer = make_napari_viewer()
     labels_layer = viewer.add_labels(label_image)
-    image_layer = viewer.add_image(np.random.random((100, 100)))
+    image_layer = viewer.add_image(np.zeros((16, 16), dtype=np.float32))
     scatter_widget = FeaturesScatterWidget(viewer)
 
     # no features in a label image
@@ -114,3 +115,62 @@ def test_get_valid_axis_keys_no_valid_keys(make_napari_viewer):
     viewer.layers.selection = [image_layer]
     valid_keys = scatter_widget._get_valid_axis_keys()
     assert set(valid_keys) == set()
+
+
+def test_features_scatter_non_finite(
+    make_napari_viewer, label_image, feature_table
+):
+    """
+    Test that points with non-finite feature values are not plotted.
+    """
+    feature_table["feature_0"][0] = np.nan
+
+    viewer = make_napari_viewer()
+    labels_layer = viewer.add_labels(label_image, features=feature_table)
+    scatter_widget = FeaturesScatterWidget(viewer)
+
+    viewer.layers.selection = [labels_layer]
+    scatter_widget.x_axis_key = "feature_0"
+    scatter_widget.y_axis_key = "feature_1"
+
+    assert scatter_widget._scatter_artist is not None
+    assert scatter_widget._scatter_artist.get_offsets().shape == (2, 2)
+
+
+def test_features_scatter_same_key(
+    make_napari_viewer, label_image, feature_table
+):
+    """
+    Test that scattering a feature against itself draws a diagonal line.
+    """
+
+    viewer = make_napari_viewer()
+    labels_layer = viewer.add_labels(label_image, features=feature_table)
+    scatter_widget = FeaturesScatterWidget(viewer)
+
+    viewer.layers.selection = [labels_layer]
+    scatter_widget.x_axis_key = "feature_0"
+    scatter_widget.y_axis_key = "feature_0"
+
+    assert len(scatter_widget.axes.collections) == 0
+    (line,) = scatter_widget.axes.get_lines()
+    feature = feature_table["feature_0"]
+    limits = [feature.min(), feature.max()]
+    np.testing.assert_allclose(line.get_xdata(), limits)
+    np.testing.assert_allclose(line.get_ydata(), limits)
+
+
+def test_features_scatter_update_layers_draws_once(
+    make_napari_viewer, label_image, feature_table, mocker
+):
+    """
+    Test that re-populating the axis selectors only re-draws once.
+    """
+    viewer = make_napari_viewer()
+    labels_layer = viewer.add_labels(label_image, features=feature_table)
+    viewer.layers.selection.clear()
+    scatter_widget = FeaturesScatterWidget(viewer)
+
+    draw = mocker.spy(scatter_widget, "draw")
+    viewer.layers.selection.add(labels_layer)
+    draw.assert_called_once()
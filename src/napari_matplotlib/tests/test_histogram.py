@@ -7,6 +7,7 @@ from napari_matplotlib import FeaturesHistogramWidget, HistogramWidget
 from napari_matplotlib.tests.helpers import (
     assert_figures_equal,
     assert_figures_not_equal,
+    fig_to_array,
 )
 
 
@@ -51,11 +52,12 @@ def test_histogram_3D(make_napari_viewer, brain_data):
 
 def test_feature_histogram(make_napari_viewer):
     n_points = 1000
-    random_points = np.random.random((n_points, 3)) * 10
-    random_directions = np.random.random((n_points, 3)) * 10
+    rng = np.random.default_rng(0)
+    random_points = rng.random((n_points, 3)) * 10
+    random_directions = rng.random((n_points, 3)) * 10
     random_vectors = np.stack([random_points, random_directions], axis=1)
-    feature1 = np.random.random(n_points)
-    feature2 = np.random.normal(size=n_points)
+    feature1 = rng.random(n_points)
+    feature2 = rng.normal(size=n_points)
 
     viewer = make_napari_viewer()
     viewer.add_points(
@@ -74,7 +76,7 @@ def test_feature_histogram(make_napari_viewer):
 
     # Check whether changing the selected key changes the plot
     widget._set_axis_keys("feature1")
-    fig1 = deepcopy(widget.figure)
+    fig1 = fig_to_array(widget.figure)
 
     widget._set_axis_keys("feature2")
     assert_figures_not_equal(widget.figure, fig1)
@@ -86,48 +88,30 @@ def test_feature_histogram(make_napari_viewer):
 
 
 @pytest.mark.mpl_image_compare
-def test_feature_histogram_vectors(make_napari_viewer):
-    n_points = 1000
-    np.random.seed(42)
-    random_points = np.random.random((n_points, 3)) * 10
-    random_directions = np.random.random((n_points, 3)) * 10
-    random_vectors = np.stack([random_points, random_directions], axis=1)
-    feature1 = np.random.random(n_points)
+def test_feature_histogram_vectors(make_napari_viewer, random_vectors_data):
+    random_vectors, properties = random_vectors_data
 
     viewer = make_napari_viewer()
-    viewer.add_vectors(
-        random_vectors,
-        properties={"feature1": feature1},
-        name="vectors1",
-    )
+    viewer.add_vectors(random_vectors, properties=properties, name="vectors1")
 
     widget = FeaturesHistogramWidget(viewer)
-    viewer.window.add_dock_widget(widget)
     widget._set_axis_keys("feature1")
 
-    fig = FeaturesHistogramWidget(viewer).figure
+    fig = widget.figure
     return deepcopy(fig)
 
 
 @pytest.mark.mpl_image_compare
-def test_feature_histogram_points(make_napari_viewer):
-    np.random.seed(0)
-    n_points = 1000
-    random_points = np.random.random((n_points, 3)) * 10
-    feature1 = np.random.random(n_points)
+def test_feature_histogram_points(make_napari_viewer, random_points_data):
+    random_points, properties = random_points_data
 
     viewer = make_napari_viewer()
-    viewer.add_points(
-        random_points,
-        properties={"feature1": feature1},
-        name="points1",
-    )
+    viewer.add_points(random_points, properties=properties, name="points1")
 
     widget = FeaturesHistogramWidget(viewer)
-    viewer.window.add_dock_widget(widget)
     widget._set_axis_keys("feature1")
 
-    fig = FeaturesHistogramWidget(viewer).figure
+    fig = widget.figure
     return deepcopy(fig)
 
 
@@ -141,7 +125,7 @@ def test_change_layer(make_napari_viewer, brain_data, astronaut_data):
     # Select first layer
     viewer.layers.selection.clear()
     viewer.layers.selection.add(viewer.layers[0])
-    fig1 = deepcopy(widget.figure)
+    fig1 = fig_to_array(widget.figure)
 
     # Re-selecting first layer should produce identical plot
     viewer.layers.selection.clear()
@@ -152,3 +136,33 @@ def test_change_layer(make_napari_viewer, brain_data, astronaut_data):
     viewer.layers.selection.clear()
     viewer.layers.selection.add(viewer.layers[1])
     assert_figures_not_equal(widget.figure, fig1)
+
+
+def test_change_layer_contrast_limits(
+    make_napari_viewer, astronaut_data, mocker
+):
+    viewer = make_napari_viewer()
+    widget = HistogramWidget(viewer)
+
+    data = astronaut_data[0][:, :, 0]
+    old_layer = viewer.add_image(data, name="old")
+    new_layer = viewer.add_image(data, name="new")
+
+    # Switch from the first layer to the second
+    viewer.layers.selection.clear()
+    viewer.layers.selection.add(old_layer)
+    viewer.layers.selection.clear()
+    viewer.layers.selection.add(new_layer)
+
+    # Changing the previously selected layer shouldn't re-draw the widget
+    draw_idle = mocker.spy(widget.figure.canvas, "draw_idle")
+    old_layer.contrast_limits = (10, 20)
+    draw_idle.assert_not_called()
+    limits = [line.get_xdata()[0] for line in widget._contrast_lines]
+    np.testing.assert_array_equal(limits, new_layer.contrast_limits)
+
+    # ...but changing the selected layer should
+    new_layer.contrast_limits = (30, 40)
+    draw_idle.assert_called_once()
+    limits = [line.get_xdata()[0] for line in widget._contrast_lines]
+    np.testing.assert_array_equal(limits, [30, 40])
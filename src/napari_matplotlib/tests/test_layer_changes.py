@@ -1,4 +1,3 @@
-from copy import deepcopy
 from typing import Any
 
 import numpy as np
@@ -16,6 +15,7 @@ from napari_matplotlib.base import NapariMPLWidget
 from napari_matplotlib.tests.helpers import (
     assert_figures_equal,
     assert_figures_not_equal,
+    fig_to_array,
 )
 
 
@@ -37,11 +37,14 @@ def test_change_one_layer(
     viewer = make_napari_viewer()
 
     widget = widget_cls(viewer)
-    # Add n copies of two different datasets
-    for _ in range(n_layers):
-        viewer.add_image(brain_data[0], **brain_data[1])
-    for _ in range(n_layers):
-        viewer.add_image(astronaut_data[0], **astronaut_data[1])
+    # Add n copies of two different datasets. Adding a layer selects it,
+    # but assert_plot_changes sets the selection itself, so don't re-draw
+    # the widget for each new layer.
+    with viewer.layers.selection.events.changed.blocker():
+        for _ in range(n_layers):
+            viewer.add_image(brain_data[0], **brain_data[1])
+        for _ in range(n_layers):
+            viewer.add_image(astronaut_data[0], **astronaut_data[1])
 
     assert len(viewer.layers) == 2 * n_layers
     assert_plot_changes(viewer, widget, n_layers=n_layers)
@@ -69,12 +72,15 @@ def assert_features_plot_changes(
     by `widget_cls` also changes.
     """
     widget = widget_cls(viewer)
-    viewer.add_points(data[0], **data[1])
-    # Change the features data for the second layer
-    data[1]["features"] = {
-        name: data + 1 for name, data in data[1]["features"].items()
-    }
-    viewer.add_points(data[0], **data[1])
+    # Don't re-draw the widget as each layer is added and selected, as
+    # assert_plot_changes sets the selection itself
+    with viewer.layers.selection.events.changed.blocker():
+        viewer.add_points(data[0], **data[1])
+        # Change the features data for the second layer
+        data[1]["features"] = {
+            name: data + 1 for name, data in data[1]["features"].items()
+        }
+        viewer.add_points(data[0], **data[1])
     assert_plot_changes(viewer, widget, n_layers=1)
 
 
@@ -86,24 +92,23 @@ def assert_plot_changes(
     is changed. The passed viewer must already have (2 * n_layers) layers
     loaded.
     """
-    # Select first layer(s)
+    # Select first layer(s). Selecting them all at once only re-draws the
+    # widget once.
     viewer.layers.selection.clear()
-
-    for i in range(n_layers):
-        viewer.layers.selection.add(viewer.layers[i])
+    viewer.layers.selection.update(viewer.layers[i] for i in range(n_layers))
     assert len(viewer.layers.selection) == n_layers
-    fig1 = deepcopy(widget.figure)
+    fig1 = fig_to_array(widget.figure)
 
     # Re-selecting first layer(s) should produce identical plot
     viewer.layers.selection.clear()
-    for i in range(n_layers):
-        viewer.layers.selection.add(viewer.layers[i])
+    viewer.layers.selection.update(viewer.layers[i] for i in range(n_layers))
     assert len(viewer.layers.selection) == n_layers
     assert_figures_equal(widget.figure, fig1)
 
     # Plotting the second layer(s) should produce a different plot
     viewer.layers.selection.clear()
-    for i in range(n_layers):
-        viewer.layers.selection.add(viewer.layers[n_layers + i])
+    viewer.layers.selection.update(
+        viewer.layers[n_layers + i] for i in range(n_layers)
+    )
     assert len(viewer.layers.selection) == n_layers
     assert_figures_not_equal(widget.figure, fig1)
@@ -1,8 +1,11 @@
 from copy import deepcopy
+from types import SimpleNamespace
 
+import numpy as np
 import pytest
 
 from napari_matplotlib import SliceWidget
+from napari_matplotlib.slice import _get_chunk_range
 
 
 @pytest.mark.mpl_image_compare
@@ -61,3 +64,126 @@ def test_slice_axes(make_napari_viewer, astronaut_data):
     assert widget.slice_selector.maximum() == data.shape[0] - 1
     # x/y are flipped in napari
     assert widget._slice_width == data.shape[1]
+
+
+def test_slice_redraw_unchanged(make_napari_viewer, astronaut_data, mocker):
+    viewer = make_napari_viewer()
+    viewer.add_image(astronaut_data[0][:, :, 0])
+
+    widget = SliceWidget(viewer)
+    draw = mocker.spy(widget, "draw")
+    # Re-drawing with the same inputs should be skipped
+    widget._draw()
+    draw.assert_not_called()
+    # ...but changing the slice should re-draw
+    widget.slice_selector.setValue(1)
+    widget._draw()
+    draw.assert_called_once()
+
+    # ...and so should replacing the layer data
+    draw.reset_mock()
+    viewer.layers[0].data = astronaut_data[0][:, :, 1]
+    widget._draw()
+    draw.assert_called_once()
+
+
+def test_slice_redraw_debounced(
+    make_napari_viewer, astronaut_data, qtbot, mocker
+):
+    viewer = make_napari_viewer()
+    data = astronaut_data[0][:, :, 0]
+    viewer.add_image(data)
+
+    widget = SliceWidget(viewer)
+    draw = mocker.spy(widget, "draw")
+    # A burst of changes should only re-draw once the timer fires...
+    with qtbot.waitSignal(widget._redraw_timer.timeout):
+        for value in range(1, 5):
+            widget.slice_selector.setValue(value)
+        draw.assert_not_called()
+    # ...and only once, with the final value
+    draw.assert_called_once()
+    assert widget._line is not None
+    np.testing.assert_array_equal(widget._line.get_ydata(), data[4])
+
+
+def test_slice_dask(make_napari_viewer, brain_data):
+    da = pytest.importorskip("dask.array")
+    viewer = make_napari_viewer()
+    data = brain_data[0]
+    layer = viewer.add_image(da.from_array(data, chunks=(1, 64, 64)))
+
+    widget = SliceWidget(viewer)
+    widget.slice_selector.setValue(10)
+    x, y = widget._get_xy()
+    z = viewer.dims.current_step[0]
+    np.testing.assert_array_equal(y, data[z, 10])
+    # Only the chunk of rows containing the slice is read into memory
+    block = widget._block
+    assert block is not None
+    assert block.shape == (64, data.shape[2])
+
+    # Moving within the same chunk re-uses it
+    widget.slice_selector.setValue(20)
+    x, y = widget._get_xy()
+    np.testing.assert_array_equal(y, data[z, 20])
+    assert widget._block is block
+
+    # ...but moving to another chunk reads that chunk instead
+    widget.slice_selector.setValue(70)
+    x, y = widget._get_xy()
+    np.testing.assert_array_equal(y, data[z, 70])
+    assert widget._block_range == range(64, 128)
+
+    # Replacing the layer data reads the new data, even within the same chunk
+    new_data = data[::-1]
+    layer.data = da.from_array(new_data, chunks=(1, 64, 64))
+    x, y = widget._get_xy()
+    np.testing.assert_array_equal(y, new_data[z, 70])
+
+
+@pytest.mark.parametrize(
+    "chunks, index, expected",
+    [
+        # dask style, with the size of every chunk
+        (((3, 3, 4),), 7, range(6, 10)),
+        # zarr/h5py style, with one chunk size
+        ((4,), 9, range(8, 10)),
+        # Not chunked
+        (None, 3, range(0, 10)),
+    ],
+)
+def test_get_chunk_range(chunks, index, expected):
+    data = SimpleNamespace(chunks=chunks, shape=(10,))
+    assert _get_chunk_range(data, 0, index) == expected
+
+
+def test_slice_blit(make_napari_viewer, qtbot, mocker):
+    viewer = make_napari_viewer()
+    # Every row contains the same values, so the axes limits don't change
+    # when moving between rows
+    data = np.array([np.roll(np.arange(32), i) for i in range(16)])
+    viewer.add_image(data)
+
+    widget = SliceWidget(viewer)
+    widget.slice_selector.setValue(1)
+    widget._draw()
+    # The full re-draw is rendered when Qt next processes events, and the
+    # background is captured after it
+    qtbot.waitUntil(lambda: widget._background is not None)
+    background = widget._background
+
+    restore_region = mocker.spy(widget.canvas, "restore_region")
+    widget.slice_selector.setValue(2)
+    widget._draw()
+    # The second re-draw only changes the line, so is blitted onto the
+    # cached background
+    restore_region.assert_called_once_with(background)
+    assert widget._background is background
+    blitted = np.array(widget.canvas.buffer_rgba(), dtype=int)
+
+    # ...which should look the same as re-drawing everything, up to
+    # anti-aliasing differences in the line
+    widget.canvas.draw()
+    full = np.array(widget.canvas.buffer_rgba(), dtype=int)
+    np.testing.assert_allclose(blitted, full, atol=2)
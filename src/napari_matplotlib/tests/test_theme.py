@@ -1,10 +1,15 @@
 import napari
 import numpy as np
 import pytest
+from matplotlib.figure import Figure
 
 from napari_matplotlib import ScatterWidget
 from napari_matplotlib.base import NapariMPLWidget
 
+# Image data for tests that only check the plot styling, not its contents
+_TEST_IMAGE = np.random.default_rng(0).random((10, 10))
+_TEST_IMAGE.setflags(write=False)
+
 
 @pytest.mark.parametrize(
     "theme_name, expected_icons",
@@ -72,12 +77,11 @@ def test_titles_respect_theme(
     widget = ScatterWidget(viewer)
     viewer.theme = theme_name
 
-    # make a scatter plot of two random layers
-    viewer.add_image(np.random.random((10, 10)), name="first test image")
-    viewer.add_image(np.random.random((10, 10)), name="second test image")
+    # make a scatter plot of two layers
+    viewer.add_image(_TEST_IMAGE, name="first test image")
+    viewer.add_image(_TEST_IMAGE, name="second test image")
     viewer.layers.selection.clear()
-    viewer.layers.selection.add(viewer.layers[0])
-    viewer.layers.selection.add(viewer.layers[1])
+    viewer.layers.selection.update([viewer.layers[0], viewer.layers[1]])
 
     ax = widget.figure.gca()
 
@@ -99,8 +103,6 @@ def test_no_theme_side_effects(make_napari_viewer):
     A MWE to guard aganst issue matplotlib/#64. Should always reproduce a plot
     with the default matplotlib style.
     """
-    import matplotlib.pyplot as plt
-
     np.random.seed(12345)
 
     # should not affect global matplotlib plot style
@@ -110,7 +112,8 @@ def test_no_theme_side_effects(make_napari_viewer):
 
     # some plotting unrelated to napari-matplotlib
     normal_dist = np.random.normal(size=1000)
-    unrelated_figure, ax = plt.subplots()
+    unrelated_figure = Figure()
+    ax = unrelated_figure.subplots()
     ax.hist(normal_dist, bins=100)
     ax.set_xlabel("something unrelated to napari (x)")
     ax.set_ylabel("something unrelated to napari (y)")
@@ -1,3 +1,5 @@
+import numpy as np
+import numpy.typing as npt
 import pytest
 from qtpy.QtCore import QSize
 from qtpy.QtGui import QImage
@@ -5,18 +7,33 @@ from qtpy.QtGui import QImage
 from napari_matplotlib import HistogramWidget, ScatterWidget, SliceWidget
 
 
+def _to_array(image: QImage) -> npt.NDArray[np.uint8]:
+    """
+    Copy the pixels of an image into a numpy array.
+    """
+    # Convert so that pixels are packed in the same way as QImage.pixel()
+    # returns them, and so there's no padding between lines
+    image = image.convertToFormat(QImage.Format.Format_ARGB32)
+    bits = image.constBits()
+    if hasattr(bits, "setsize"):
+        # PyQt returns a sip.voidptr, which needs telling its size
+        bits.setsize(image.sizeInBytes())
+    return np.frombuffer(bits, dtype=np.uint8).copy()
+
+
 def _are_different(a: QImage, b: QImage) -> bool:
     """
-    Check that a and b are identical, pixel by pixel. Via a stupid nested for loop.
+    Check whether a and b differ in any pixel.
     """
     assert not a.isNull()
     assert not b.isNull()
     assert a.size() == b.size()
-    for x in range(a.width()):
-        for y in range(a.height()):
-            if a.pixel(x, y) != b.pixel(x, y):
-                return True  # exit quickly
-    return False
+    # QImage equality compares the pixel data in C++, so identical images
+    # don't need copying. Images in different formats can still have the
+    # same pixels, so those are compared as arrays.
+    if a == b:
+        return False
+    return not np.array_equal(_to_array(a), _to_array(b))
 
 
 @pytest.mark.parametrize(
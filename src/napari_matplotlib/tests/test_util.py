@@ -4,7 +4,27 @@ import sys
 import pytest
 from qtpy.QtCore import QSize
 
-from napari_matplotlib.util import Interval, from_napari_css_get_size_of
+from napari_matplotlib.util import (
+    Interval,
+    _get_size_from_stylesheet,
+    _parse_stylesheet,
+    from_napari_css_get_size_of,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_stylesheet_caches():
+    """
+    Clear the cached stylesheet lookups around each test.
+
+    Otherwise a test could get sizes (and miss warnings) cached by a
+    previous test that used the same stylesheet.
+    """
+    _parse_stylesheet.cache_clear()
+    _get_size_from_stylesheet.cache_clear()
+    yield
+    _parse_stylesheet.cache_clear()
+    _get_size_from_stylesheet.cache_clear()
 
 
 def test_version_fallback(mocker):
@@ -26,7 +46,10 @@ def test_interval():
     assert 10 not in interval
 
     with pytest.raises(ValueError, match="must be an integer"):
-        assert "string" in interval  # type: ignore[operator]
+        assert "string" in interval
+
+    with pytest.raises(ValueError, match="must be an integer"):
+        assert True in interval
 
     with pytest.raises(ValueError, match="must be <= upper_bound"):
         Interval(5, 3)
@@ -62,6 +85,9 @@ def test_get_size_from_css(mocker):
         """
     mocker.patch("napari.qt.get_current_stylesheet").return_value = test_css
     assert from_napari_css_get_size_of("Flibble", (1, 2)) == QSize(123, 456)
+    # Second lookup comes from the cache
+    assert from_napari_css_get_size_of("Flibble", (1, 2)) == QSize(123, 456)
+    assert _get_size_from_stylesheet.cache_info().hits == 1
 
 
 def test_fallback_if_missing_dimensions(mocker):
@@ -80,3 +106,16 @@ def test_fallback_if_prelude_not_in_css():
     doesntexist = "AQButtonThatDoesntExist"
     with pytest.warns(RuntimeWarning, match=f"Unable to find {doesntexist}"):
         assert from_napari_css_get_size_of(doesntexist, (1, 2)) == QSize(1, 2)
+
+
+def test_get_size_from_css_split_rules(mocker):
+    """Test getting the max-width and max-height when set in separate rules"""
+    test_css = """
+        Flibble { max-width : 123px; }
+        Flibble { max-height : 456px; }
+        """
+    mocker.patch("napari.qt.get_current_stylesheet").return_value = test_css
+    with pytest.warns(RuntimeWarning, match="Unable to find DimensionToken"):
+        assert from_napari_css_get_size_of("Flibble", (1, 2)) == QSize(
+            123, 456
+        )
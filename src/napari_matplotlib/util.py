@@ -1,9 +1,12 @@
+import math
+from functools import cached_property, lru_cache
 from warnings import warn
 
 import napari.qt
 import tinycss2
 from napari.utils.theme import Theme
 from qtpy.QtCore import QSize
+from tinycss2.ast import DimensionToken, IdentToken, WhitespaceToken
 
 
 class Interval:
@@ -27,6 +30,9 @@ class Interval:
 
         self.lower = lower_bound
         self.upper = upper_bound
+        # Bounds with open ends replaced by infinity, for membership tests
+        self._min = -math.inf if lower_bound is None else lower_bound
+        self._max = math.inf if upper_bound is None else upper_bound
 
     def __repr__(self) -> str:
         """
@@ -34,22 +40,21 @@ class Interval:
         """
         return f"Interval({self.lower}, {self.upper})"
 
-    def __contains__(self, val: int) -> bool:
+    def __contains__(self, val: object) -> bool:
         """
         Return True if val is in the current interval.
         """
-        if not isinstance(val, int):
+        # bool is a subclass of int, but is never a valid number of layers
+        if isinstance(val, bool) or not isinstance(val, int):
             raise ValueError("variable must be an integer")
-        if self.lower is not None and val < self.lower:
-            return False
-        if self.upper is not None and val > self.upper:
-            return False
-        return True
+        return self._min <= val <= self._max
 
-    @property
+    @cached_property
     def _helper_text(self) -> str | None:
         """
         Helper text for widgets.
+
+        This only depends on the bounds, so is computed once and cached.
         """
         if self.lower is None and self.upper is None:
             helper_text = None
@@ -81,26 +86,43 @@ def _has_id(nodes: list[tinycss2.ast.Node], id_name: str) -> bool:
     Is `id_name` in IdentTokens in the list of CSS `nodes`?
     """
     return any(
-        [node.type == "ident" and node.value == id_name for node in nodes]
+        type(node) is IdentToken and node.value == id_name for node in nodes
     )
 
 
-def _get_dimension(nodes: list[tinycss2.ast.Node], id_name: str) -> int | None:
+def _get_dimensions(nodes: list[tinycss2.ast.Node]) -> dict[str, int]:
+    """
+    Get the values of DimensionTokens, keyed by the name of their IdentToken.
+
+    If a name appears more than once, the first value is used.
+    """
+    dimensions: dict[str, int] = {}
+    # Walk the non-whitespace tokens once, in groups of four
+    # (name, colon, value, semicolon), without copying them into a list
+    # Token types are checked by class, which is quicker than comparing
+    # their `type` strings
+    tokens = (node for node in nodes if type(node) is not WhitespaceToken)
+    for name, _, value, _ in zip(*(tokens,) * 4, strict=False):
+        if type(name) is IdentToken and type(value) is DimensionToken:
+            dimensions.setdefault(name.value, value.int_value)
+    return dimensions
+
+
+def _get_dimension(dimensions: dict[str, int], id_name: str) -> int | None:
     """
     Get the value of the DimensionToken for the IdentToken `id_name`.
 
+    Parameters
+    ----------
+    dimensions :
+        Dimensions of a CSS rule, as returned by `_get_dimensions`.
+
     Returns
     -------
         None if no IdentToken is found.
     """
-    cleaned_nodes = [node for node in nodes if node.type != "whitespace"]
-    for name, _, value, _ in zip(*(iter(cleaned_nodes),) * 4, strict=False):
-        if (
-            name.type == "ident"
-            and value.type == "dimension"
-            and name.value == id_name
-        ):
-            return value.int_value
+    if id_name in dimensions:
+        return dimensions[id_name]
     warn(
         f"Unable to find DimensionToken for {id_name}",
         RuntimeWarning,
@@ -109,6 +131,52 @@ def _get_dimension(nodes: list[tinycss2.ast.Node], id_name: str) -> int | None:
     return None
 
 
+@lru_cache(maxsize=4)
+def _parse_stylesheet(stylesheet: str) -> tuple[tinycss2.ast.Node, ...]:
+    """
+    Parse a CSS stylesheet into its rules.
+
+    The result is cached, as napari's stylesheet only changes with the theme.
+    """
+    return tuple(
+        tinycss2.parse_stylesheet(
+            stylesheet,
+            skip_comments=True,
+            skip_whitespace=True,
+        )
+    )
+
+
+@lru_cache(maxsize=32)
+def _get_size_from_stylesheet(
+    qt_element_name: str, stylesheet: str
+) -> tuple[int, int] | None:
+    """
+    Get the max-width and max-height of `qt_element_name` from `stylesheet`.
+
+    The result is cached, so repeated lookups don't re-scan the rules.
+
+    Returns
+    -------
+        None if the element or its size isn't found.
+    """
+    if qt_element_name not in stylesheet:
+        # Quick check, to avoid parsing the stylesheet if the element's name
+        # can't be in any of its rules
+        return None
+    w, h = None, None
+    for rule in _parse_stylesheet(stylesheet):
+        if _has_id(rule.prelude, qt_element_name):
+            dimensions = _get_dimensions(rule.content)
+            # The dimensions may be set in different rules for the element,
+            # so keep any found in earlier rules
+            w = w or _get_dimension(dimensions, "max-width")
+            h = h or _get_dimension(dimensions, "max-height")
+            if w and h:
+                return w, h
+    return None
+
+
 def from_napari_css_get_size_of(
     qt_element_name: str, fallback: tuple[int, int]
 ) -> QSize:
@@ -122,18 +190,11 @@ def from_napari_css_get_size_of(
     -------
         QSize of the element if it's found, the `fallback` if it's not found..
     """
-    rules = tinycss2.parse_stylesheet(
-        napari.qt.get_current_stylesheet(),
-        skip_comments=True,
-        skip_whitespace=True,
+    size = _get_size_from_stylesheet(
+        qt_element_name, napari.qt.get_current_stylesheet()
     )
-    w, h = None, None
-    for rule in rules:
-        if _has_id(rule.prelude, qt_element_name):
-            w = _get_dimension(rule.content, "max-width")
-            h = _get_dimension(rule.content, "max-height")
-            if w and h:
-                return QSize(w, h)
+    if size is not None:
+        return QSize(*size)
     warn(
         f"Unable to find {qt_element_name} or unable to find its size in "
         f"the current Napari stylesheet, falling back to {fallback}",
@@ -156,23 +217,27 @@ def style_sheet_from_theme(theme: Theme) -> dict[str, str]:
     Dict[str, str]
         Matplotlib compatible style dictionary.
     """
+    # Convert each colour to hex once, as several are used for many keys
+    secondary = theme.secondary.as_hex()
+    text = theme.text.as_hex()
+    foreground = theme.foreground.as_hex()
     return {
-        "axes.edgecolor": theme.secondary.as_hex(),
+        "axes.edgecolor": secondary,
         # BUG: could be the same as napari canvas, but facecolors do not get
         #     updated upon redraw for what ever reason
         #'axes.facecolor':theme.canvas.as_hex(),
         "axes.facecolor": "none",
-        "axes.labelcolor": theme.text.as_hex(),
-        "boxplot.boxprops.color": theme.text.as_hex(),
-        "boxplot.capprops.color": theme.text.as_hex(),
-        "boxplot.flierprops.markeredgecolor": theme.text.as_hex(),
-        "boxplot.whiskerprops.color": theme.text.as_hex(),
-        "figure.edgecolor": theme.secondary.as_hex(),
+        "axes.labelcolor": text,
+        "boxplot.boxprops.color": text,
+        "boxplot.capprops.color": text,
+        "boxplot.flierprops.markeredgecolor": text,
+        "boxplot.whiskerprops.color": text,
+        "figure.edgecolor": secondary,
         # BUG: should be the same as napari background, but facecolors do not get
         #     updated upon redraw for what ever reason
         #'figure.facecolor':theme.background.as_hex(),
         "figure.facecolor": "none",
-        "grid.color": theme.foreground.as_hex(),
+        "grid.color": foreground,
         # COMMENT: the hard coded colors are to match the previous behaviour
         #         alternativly we could use the theme to style the legend as well
         #'legend.edgecolor':theme.secondary.as_hex(),
@@ -181,9 +246,9 @@ def style_sheet_from_theme(theme: Theme) -> dict[str, str]:
         "legend.facecolor": "white",
         #'legend.labelcolor':theme.text.as_hex()
         "legend.labelcolor": "black",
-        "text.color": theme.text.as_hex(),
-        "xtick.color": theme.secondary.as_hex(),
-        "xtick.labelcolor": theme.text.as_hex(),
-        "ytick.color": theme.secondary.as_hex(),
-        "ytick.labelcolor": theme.text.as_hex(),
+        "text.color": text,
+        "xtick.color": secondary,
+        "xtick.labelcolor": text,
+        "ytick.color": secondary,
+        "ytick.labelcolor": text,
     }